@@ -1,87 +1,209 @@
 import sqlite3
 import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from datetime import date, timedelta
+import numpy as np
 from faker import Faker
 
+# One Faker instance shared by every manager in the process
+_FAKE = Faker()
+
+# Students are generated in fixed-size chunks so the output does not depend
+# on how many workers run them
+STUDENT_CHUNK_SIZE = 10000
+
+def _years_before(day, years):
+    """Return the same calendar day the given number of years earlier"""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        # Feb 29 in a non-leap year falls back to Feb 28
+        return day.replace(year=day.year - years, day=28)
+
+def _gen_chunk(start_id, num_students, seed, first_pool, last_pool, today):
+    """Generate student rows with ids starting at start_id"""
+    rng = random.Random(seed)
+
+    gender_options = ['Male', 'Female', 'Other']
+    status_options = ['Active', 'Inactive', 'Graduated', 'Suspended']
+
+    first_names = rng.choices(first_pool, k=num_students)
+    last_names = rng.choices(last_pool, k=num_students)
+
+    # Students are 18-30 years old on today's date, leap days included
+    earliest = (_years_before(today, 31) + timedelta(days=1)).toordinal()
+    latest = _years_before(today, 18).toordinal()
+    # ISO strings bind directly, skipping sqlite3's date adapter per row
+    dobs = [date.fromordinal(rng.randint(earliest, latest)).isoformat()
+            for _ in range(num_students)]
+
+    # Draw every column up front rather than per student
+    genders = rng.choices(gender_options, k=num_students)
+    statuses = rng.choices(status_options, k=num_students)
+    credits = [rng.randint(0, 120) for _ in range(num_students)]
+    # Hundredths of a grade point, sampled as integers
+    gpas = [rng.randint(200, 400) / 100.0 for _ in range(num_students)]
+
+    # The id suffix keeps emails unique without coordinating across chunks
+    student_ids = range(start_id, start_id + num_students)
+    return [
+        (student_id, first_name, last_name, gender, dob,
+         f"{first_name.lower()}.{last_name.lower()}.{student_id}@university.edu",
+         status, total_credits, gpa)
+        for student_id, first_name, last_name, gender, dob,
+            status, total_credits, gpa
+        in zip(student_ids, first_names, last_names, genders, dobs,
+               statuses, credits, gpas)
+    ]
+
 class UniversityDatabaseManager:
-    def __init__(self, db_name='university_database.db'):
+    def __init__(self, db_name='university_database.db', validate=False, seed=0,
+                 num_students=1200, workers=1):
         self.db_name = db_name
-        self.fake = Faker()
+        self.validate = validate
+        self.seed = seed
+        self.num_students = num_students
+        # Worker processes for student generation; parallelism is opt-in
+        self.workers = workers
+        self.fake = _FAKE
         self.conn = None
         self.cursor = None
-        self.used_emails = set()
+        self._insert_sql = {}
+        self._student_ids = []
+        self._course_ids = []
 
     def create_connection(self):
         """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_name)
+        # Build in memory; save_to_disk writes the finished file in one pass
+        # Transactions are issued explicitly in run_database_generation
+        self.conn = sqlite3.connect(':memory:', isolation_level=None)
         self.cursor = self.conn.cursor()
 
-    def generate_unique_email(self, first_name, last_name):
-        """Generate a unique email address"""
-        base_email = f"{first_name.lower()}.{last_name.lower()}"
-        email = f"{base_email}@university.edu"
-        counter = 1
-        
-        while email in self.used_emails:
-            email = f"{base_email}{counter}@university.edu"
-            counter += 1
-        
-        self.used_emails.add(email)
-        return email
+        # Must be set before the first table is created to take effect
+        self.cursor.execute("PRAGMA page_size=8192")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute("PRAGMA cache_size=-65536")
+        # Foreign keys are not checked during the bulk load
+        self.cursor.execute("PRAGMA foreign_keys=OFF")
+
+    def save_to_disk(self):
+        """Copy the in-memory database to the database file"""
+        dst = sqlite3.connect(self.db_name)
+        try:
+            # A file left in WAL mode by an earlier run would reject a
+            # backup that changes its page size
+            dst.execute("PRAGMA journal_mode=DELETE")
+            self.conn.backup(dst)
+        finally:
+            dst.close()
+
+    def bulk_insert(self, table, cols, rows, batch=500):
+        """Insert rows using multi-row VALUES statements of up to batch rows"""
+        # Keep each statement under SQLite's bound-parameter limit, which is
+        # only 999 in builds before 3.32
+        if hasattr(self.conn, 'getlimit'):
+            max_vars = self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        else:
+            max_vars = 999
+        batch = max(1, min(batch, max_vars // len(cols)))
+
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, batch))
+            if not chunk:
+                break
+
+            key = (table, cols, len(chunk))
+            sql = self._insert_sql.get(key)
+            if sql is None:
+                placeholders = f"({', '.join(['?'] * len(cols))})"
+                sql = (f"INSERT INTO {table} ({', '.join(cols)}) VALUES "
+                       + ", ".join([placeholders] * len(chunk)))
+                self._insert_sql[key] = sql
+
+            self.cursor.execute(sql, list(chain.from_iterable(chunk)))
 
     def create_tables(self):
         """Create database schema"""
-        # Drop existing tables to prevent constraint issues
-        tables = ['Enrollments', 'Courses', 'Departments', 'Students']
-        for table in tables:
-            self.cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        # The whole DDL runs as one script; it commits implicitly, so this
+        # must run before the load transaction starts
+        self.cursor.executescript('''
+        -- Drop existing tables to prevent constraint issues
+        DROP TABLE IF EXISTS Enrollments;
+        DROP TABLE IF EXISTS Courses;
+        DROP TABLE IF EXISTS Departments;
+        DROP TABLE IF EXISTS Students;
 
-        # Students Table
-        self.cursor.execute('''
+        -- Students Table
         CREATE TABLE Students (
-            student_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER PRIMARY KEY,
             first_name TEXT NOT NULL,
             last_name TEXT NOT NULL,
-            gender TEXT CHECK(gender IN ('Male', 'Female', 'Other')),
+            gender TEXT,
             date_of_birth DATE,
-            email TEXT UNIQUE,
-            enrollment_status TEXT CHECK(enrollment_status IN ('Active', 'Inactive', 'Graduated', 'Suspended')),
+            email TEXT,
+            enrollment_status TEXT,
             total_credits INTEGER,
-            gpa REAL CHECK(gpa BETWEEN 0.0 AND 4.0)
-        )''')
+            gpa REAL
+        );
 
-        # Departments Table
-        self.cursor.execute('''
+        -- Departments Table
         CREATE TABLE Departments (
             department_id INTEGER PRIMARY KEY AUTOINCREMENT,
             department_name TEXT UNIQUE NOT NULL,
             established_year INTEGER
-        )''')
+        );
 
-        # Courses Table
-        self.cursor.execute('''
+        -- Courses Table
         CREATE TABLE Courses (
             course_id TEXT PRIMARY KEY,
             course_name TEXT NOT NULL,
             department_id INTEGER,
             credit_hours INTEGER,
-            course_level TEXT CHECK(course_level IN ('Introductory', 'Intermediate', 'Advanced')),
+            course_level TEXT,
             FOREIGN KEY(department_id) REFERENCES Departments(department_id)
-        )''')
+        );
 
-        # Enrollments Table
-        self.cursor.execute('''
+        -- Enrollments Table
         CREATE TABLE Enrollments (
-            enrollment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            enrollment_id INTEGER PRIMARY KEY,
             student_id INTEGER,
             course_id TEXT,
-            semester TEXT CHECK(semester IN ('Fall', 'Spring', 'Summer')),
+            semester TEXT,
             academic_year INTEGER,
-            grade REAL CHECK(grade BETWEEN 0.0 AND 4.0),
+            grade REAL,
             FOREIGN KEY(student_id) REFERENCES Students(student_id),
-            FOREIGN KEY(course_id) REFERENCES Courses(course_id),
-            UNIQUE(student_id, course_id, semester, academic_year)
-        )''')
+            FOREIGN KEY(course_id) REFERENCES Courses(course_id)
+        );
+        ''')
+
+    def create_indexes(self):
+        """Create unique indexes once the tables are loaded"""
+        # Built in one pass after the load instead of maintained per insert
+        self.cursor.execute('''
+        CREATE UNIQUE INDEX idx_students_email ON Students(email)''')
+        self.cursor.execute('''
+        CREATE UNIQUE INDEX idx_enroll_uniq
+        ON Enrollments(student_id, course_id, semester, academic_year)''')
+
+    def validate_data(self):
+        """Check loaded rows against the rules the schema no longer enforces"""
+        # The tables are created without CHECK constraints to speed up the load
+        rules = [
+            ('Students', "gender IN ('Male', 'Female', 'Other')"),
+            ('Students', "enrollment_status IN ('Active', 'Inactive', 'Graduated', 'Suspended')"),
+            ('Students', "gpa BETWEEN 0.0 AND 4.0"),
+            ('Courses', "course_level IN ('Introductory', 'Intermediate', 'Advanced')"),
+            ('Enrollments', "semester IN ('Fall', 'Spring', 'Summer')"),
+            ('Enrollments', "grade BETWEEN 0.0 AND 4.0"),
+        ]
+        for table, rule in rules:
+            self.cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE NOT ({rule})")
+            invalid = self.cursor.fetchone()[0]
+            if invalid:
+                raise sqlite3.IntegrityError(
+                    f"{invalid} rows in {table} fail check: {rule}")
 
     def generate_departments(self):
         """Generate department data"""
@@ -105,114 +227,144 @@ class UniversityDatabaseManager:
         departments = self.cursor.fetchall()
 
         courses = []
+        self._course_ids = []
         course_levels = ['Introductory', 'Intermediate', 'Advanced']
         for dept_id, dept_name in departments:
-            for level in course_levels:
+            prefix = dept_name[:3].upper()
+            # Distinct numbers so a department never repeats a course_id
+            numbers = random.sample(range(100, 1000), k=len(course_levels))
+            for level, number in zip(course_levels, numbers):
                 course_name = f"{dept_name} {level} Course"
-                course_id = f"{dept_name[:3].upper()}{random.randint(100, 999)}"
+                course_id = f"{prefix}{number}"
                 credit_hours = random.choice([3, 4])
                 
                 courses.append((course_id, course_name, dept_id, credit_hours, level))
+                self._course_ids.append(course_id)
         
-        self.cursor.executemany("""
-            INSERT INTO Courses 
-            (course_id, course_name, department_id, credit_hours, course_level) 
-            VALUES (?, ?, ?, ?, ?)
-        """, courses)
+        self.bulk_insert(
+            'Courses',
+            ('course_id', 'course_name', 'department_id', 'credit_hours',
+             'course_level'),
+            courses
+        )
 
-    def generate_students(self, num_students=1200):
+    def generate_students(self, num_students=1200, workers=1):
         """Generate student data"""
-        gender_options = ['Male', 'Female', 'Other']
-        status_options = ['Active', 'Inactive', 'Graduated', 'Suspended']
-        
-        students = []
-        for _ in range(num_students):
-            first_name = self.fake.first_name()
-            last_name = self.fake.last_name()
-            gender = random.choice(gender_options)
-            dob = self.fake.date_of_birth(minimum_age=18, maximum_age=30)
-            email = self.generate_unique_email(first_name, last_name)
-            status = random.choice(status_options)
-            total_credits = random.randint(0, 120)
-            gpa = round(random.uniform(2.0, 4.0), 2)
-
-            students.append((
-                first_name, last_name, gender, dob, email, 
-                status, total_credits, gpa
-            ))
+        # Sample Faker once into name pools instead of once per student
+        first_pool = [self.fake.first_name() for _ in range(500)]
+        last_pool = [self.fake.last_name() for _ in range(1000)]
+        today = date.today()
 
-        self.cursor.executemany("""
-            INSERT INTO Students 
-            (first_name, last_name, gender, date_of_birth, 
-            email, enrollment_status, total_credits, gpa) 
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, students)
+        # Each chunk gets its own seed so results match however they are run
+        chunks = [
+            (start_id, min(STUDENT_CHUNK_SIZE, num_students - start_id + 1),
+             random.randrange(2 ** 32), first_pool, last_pool, today)
+            for start_id in range(1, num_students + 1, STUDENT_CHUNK_SIZE)
+        ]
+
+        workers = min(workers, len(chunks))
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_gen_chunk, *chunk) for chunk in chunks]
+                students = list(chain.from_iterable(f.result() for f in futures))
+        else:
+            students = list(chain.from_iterable(
+                _gen_chunk(*chunk) for chunk in chunks))
+
+        # Student ids are assigned here so enrollments can reuse them
+        self._student_ids = list(range(1, num_students + 1))
+
+        self.bulk_insert(
+            'Students',
+            ('student_id', 'first_name', 'last_name', 'gender', 'date_of_birth',
+             'email', 'enrollment_status', 'total_credits', 'gpa'),
+            students
+        )
 
     def generate_enrollments(self):
         """Generate enrollment data"""
-        # Get all students and courses
-        self.cursor.execute("SELECT student_id FROM Students")
-        students = [student[0] for student in self.cursor.fetchall()]
-        
-        self.cursor.execute("SELECT course_id FROM Courses")
-        courses = [course[0] for course in self.cursor.fetchall()]
-        
+        # Reuse the ids recorded while generating students and courses
+        students = np.array(self._student_ids, dtype=np.int32)
+        courses = self._course_ids
+
         semesters = ['Fall', 'Spring', 'Summer']
-        academic_years = list(range(2018, 2024))
+        max_courses = 5
 
-        enrollments = []
-        # Each student enrolls in 3-5 courses
-        for student_id in students:
-            num_courses = random.randint(3, 5)
-            enrolled_courses = random.sample(courses, num_courses)
-            
-            for course_id in enrolled_courses:
-                semester = random.choice(semesters)
-                academic_year = random.choice(academic_years)
-                grade = round(random.uniform(2.0, 4.0), 2)
+        # Each student enrolls in 3-5 courses; every field is drawn as a column
+        n_per_student = np.random.randint(3, max_courses + 1, size=len(students))
+        total = int(n_per_student.sum())
 
-                enrollments.append((
-                    student_id, course_id, semester, 
-                    academic_year, grade
-                ))
+        # Partial Fisher-Yates on one index buffer, a row per student; only
+        # the first max_courses slots are shuffled, giving distinct courses
+        rows = np.arange(len(students))
+        order = np.tile(np.arange(len(courses), dtype=np.int16), (len(students), 1))
+        for i in range(max_courses):
+            j = np.random.randint(i, len(courses), size=len(students))
+            order[rows, i], order[rows, j] = order[rows, j], order[rows, i]
+        taken = np.arange(max_courses) < n_per_student[:, None]
 
-        self.cursor.executemany("""
-            INSERT INTO Enrollments 
-            (student_id, course_id, semester, academic_year, grade) 
-            VALUES (?, ?, ?, ?, ?)
-        """, enrollments)
+        # The buffer stays as packed columns; course and semester columns are
+        # small indices into the shared string lists
+        student_col = np.repeat(students, n_per_student)
+        course_idx = order[:, :max_courses][taken]
+        semester_idx = np.random.randint(len(semesters), size=total, dtype=np.int8)
+        year_col = np.random.randint(2018, 2024, total, dtype=np.int16)
+        # Hundredths of a grade point, sampled as integers
+        grade_col = np.random.randint(200, 401, total) / 100.0
+
+        # Iterating a memoryview yields Python numbers one row at a time, and
+        # the string columns reuse the same str objects for every row
+        enrollments = zip(
+            memoryview(student_col),
+            map(courses.__getitem__, memoryview(course_idx)),
+            map(semesters.__getitem__, memoryview(semester_idx)),
+            memoryview(year_col),
+            memoryview(grade_col)
+        )
+
+        self.bulk_insert(
+            'Enrollments',
+            ('student_id', 'course_id', 'semester', 'academic_year', 'grade'),
+            enrollments
+        )
 
     def run_database_generation(self):
         """Execute full database generation process"""
         try:
+            # Seeded so runs on the same day produce the same data; ages are
+            # counted back from the current date
+            random.seed(self.seed)
+            Faker.seed(self.seed)
+            np.random.seed(self.seed)
+
             self.create_connection()
             self.create_tables()
-            
+
+            # Load all data in a single write transaction
+            self.cursor.execute("BEGIN IMMEDIATE")
             self.generate_departments()
-            self.conn.commit()
-            
             self.generate_courses()
-            self.conn.commit()
-            
-            self.generate_students()
-            self.conn.commit()
-            
+            self.generate_students(self.num_students, self.workers)
             self.generate_enrollments()
-            self.conn.commit()
-            
+            self.create_indexes()
+            if self.validate:
+                self.validate_data()
+            self.cursor.execute("COMMIT")
+
+            self.save_to_disk()
+
             print("University Database generated successfully!")
             
-            # Verification queries
-            self.cursor.execute("SELECT COUNT(*) FROM Students")
-            student_count = self.cursor.fetchone()[0]
+            # Verification query
+            self.cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM Students),
+                       (SELECT COUNT(*) FROM Courses),
+                       (SELECT COUNT(*) FROM Enrollments)
+            """)
+            student_count, course_count, enrollment_count = self.cursor.fetchone()
             print(f"Total Students: {student_count}")
-            
-            self.cursor.execute("SELECT COUNT(*) FROM Courses")
-            course_count = self.cursor.fetchone()[0]
             print(f"Total Courses: {course_count}")
-            
-            self.cursor.execute("SELECT COUNT(*) FROM Enrollments")
-            enrollment_count = self.cursor.fetchone()[0]
             print(f"Total Enrollments: {enrollment_count}")
             
         except sqlite3.Error as e: